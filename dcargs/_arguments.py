@@ -1,17 +1,46 @@
 import argparse
 import dataclasses
 import enum
+import functools
+import re
 import shlex
-from typing import Any, Dict, Optional, Set, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from . import _docstrings, _instantiators
 
-
-@dataclasses.dataclass(frozen=True)
+# Fields of `ArgumentDefinition` that are passed directly to argparse's add_argument()
+# method as keyword arguments. `name` is excluded; the flag is passed positionally.
+_ARGPARSE_FIELD_NAMES = (
+    "type",
+    "default",
+    "required",
+    "action",
+    "nargs",
+    "choices",
+    "metavar",
+    "help",
+    "dest",
+)
+
+
+@dataclasses.dataclass
 class ArgumentDefinition:
     """Options for defining arguments. Contains all necessary arguments for argparse's
     add_argument() method.
 
+    Mutable only so `make_from_field()` can apply transformations in place; this should
+    be treated as immutable once constructed.
+
     TODO: this class (as well as major other parts of this library) has succumbed a bit
     to entropy and could benefit from some refactoring."""
 
@@ -27,50 +56,87 @@ class ArgumentDefinition:
     # Important: from here on out, all fields correspond 1:1 to inputs to argparse's
     # add_argument() method.
     name: str
-    type: Optional[Union[Type, TypeVar]]
+    type: Optional[Union[Type, TypeVar]]  # Set to `str` or `None` once populated.
     default: Optional[Any]
 
     # Fields that will be handled by argument transformations.
     required: bool = False
     action: Optional[str] = None
     nargs: Optional[Union[int, str]] = None
-    choices: Optional[Set[Any]] = None
+    choices: Optional[Tuple[str, ...]] = None
     metavar: Optional[Union[str, Tuple[str, ...]]] = None
     help: Optional[str] = None
     dest: Optional[str] = None
 
+    # Lazily formatted default for helptext. Passed to add_argument() via a custom
+    # action; see `_StoreWithDefaultHelptext`.
+    default_helptext: Optional["_DefaultHelptext"] = None
+
+    # Cached flag and keyword arguments for add_argument(). Populated on first use.
+    _flag: Optional[str] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _argparse_kwargs: Optional[Dict[str, Any]] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def add_argument(
         self, parser: Union[argparse.ArgumentParser, argparse._ArgumentGroup]
     ) -> None:
         """Add a defined argument to a parser."""
-        kwargs = {k: v for k, v in vars(self).items() if v is not None}
+        if self._argparse_kwargs is None:
+            self._argparse_kwargs = self._make_argparse_kwargs()
+
+        # Note that the name must be passed in as a position argument.
+        parser.add_argument(self.get_flag(), **self._argparse_kwargs)
+
+    def _make_argparse_kwargs(self) -> Dict[str, Any]:
+        """Build keyword arguments for argparse's add_argument() method."""
+        kwargs: Dict[str, Any] = {}
+        for name in _ARGPARSE_FIELD_NAMES:
+            value = getattr(self, name)
+            if value is not None:
+                kwargs[name] = value
 
         # Apply prefix for nested dataclasses.
         if "dest" in kwargs:
             kwargs["dest"] = self.prefix + kwargs["dest"]
 
-        # Important: as far as argparse is concerned, all inputs are strings.
-        #
-        # Conversions from strings to our desired types happen in the "field action";
-        # this is a bit more flexible, and lets us handle more complex types like enums
-        # and multi-type tuples.
-        if "type" in kwargs:
-            kwargs["type"] = str
-        if "choices" in kwargs:
-            kwargs["choices"] = list(map(str, kwargs["choices"]))
-
-        kwargs.pop("field")
-        kwargs.pop("parent_class")
-        kwargs.pop("prefix")
-        kwargs.pop("instantiator")
-        kwargs.pop("name")
-
-        # Note that the name must be passed in as a position argument.
-        parser.add_argument(self.get_flag(), **kwargs)
+        if self.default_helptext is not None:
+            # Defaults are only shown for arguments without an action (boolean flags
+            # are excluded), so we're free to substitute our own.
+            assert "action" not in kwargs
+            kwargs["action"] = _StoreWithDefaultHelptext
+            kwargs[_DEFAULT_HELPTEXT_KEY] = self.default_helptext
+
+        return kwargs
+
+    def with_prefix(self, prefix: str) -> "ArgumentDefinition":
+        """Get a copy of this definition with a different prefix. Cheaper than
+        `dataclasses.replace()`, which needs to inspect the dataclass fields."""
+        return ArgumentDefinition(
+            prefix=prefix,
+            field=self.field,
+            parent_class=self.parent_class,
+            instantiator=self.instantiator,
+            name=self.name,
+            type=self.type,
+            default=self.default,
+            required=self.required,
+            action=self.action,
+            nargs=self.nargs,
+            choices=self.choices,
+            metavar=self.metavar,
+            help=self.help,
+            dest=self.dest,
+            default_helptext=self.default_helptext,
+        )
 
     def get_flag(self) -> str:
         """Get --flag representation, with a prefix applied for nested dataclasses."""
-        return "--" + (self.prefix + self.name).replace("_", "-")
+        if self._flag is None:
+            self._flag = "--" + (self.prefix + self.name).replace("_", "-")
+        return self._flag
 
     @staticmethod
     def make_from_field(
@@ -80,140 +146,286 @@ class ArgumentDefinition:
         default: Optional[Any],
     ) -> "ArgumentDefinition":
         """Create an argument definition from a field. Also returns a field action, which
-        specifies special instructions for reconstruction."""
+        specifies special instructions for reconstruction.
+
+        Results are memoized, so the returned definition may be shared and should not be
+        mutated; use `with_prefix()` instead."""
 
         assert field.init, "Field must be in class constructor"
 
-        arg = ArgumentDefinition(
-            prefix="",
-            field=field,
-            parent_class=parent_class,
-            instantiator=None,
-            name=field.name,
-            type=field.type,
-            default=default,
+        default_key = _default_cache_key(default)
+        if default_key is None:
+            # Defaults that we can't safely compare skip the cache.
+            return _make_from_field(parent_class, field, type_from_typevar, default)
+
+        return _make_from_field_cached(
+            _FieldKey(
+                parent_class=parent_class,
+                field_name=field.name,
+                type_from_typevar=frozenset(type_from_typevar.items()),
+                default_key=default_key,
+                field=field,
+                default=default,
+            )
         )
-        arg = _transform_required_if_default_set(arg)
-        arg = _transform_handle_boolean_flags(arg)
-        arg = _transform_recursive_instantiator_from_type(arg, type_from_typevar)
-        arg = _transform_generate_helptext(arg)
-        arg = _transform_convert_defaults_to_strings(arg)
-        return arg
 
 
-def _transform_required_if_default_set(arg: ArgumentDefinition) -> ArgumentDefinition:
-    """Set `required=True` if a default value is set."""
+_CACHEABLE_DEFAULT_TYPES = (str, int, float, bool, enum.Enum, type(None))
+_CACHEABLE_DEFAULT_SEQUENCE_TYPES = (tuple, list, set, frozenset)
 
-    # Mark arg as required if a default is set.
-    if arg.default is None:
-        return dataclasses.replace(arg, required=True)
-    return arg
 
+def _default_cache_key(default: Optional[Any]) -> Optional[Hashable]:
+    """Get a key for memoizing on a default value, or `None` if it shouldn't be cached.
 
-def _transform_handle_boolean_flags(arg: ArgumentDefinition) -> ArgumentDefinition:
-    """"""
-    if arg.type is not bool:
-        return arg
-
-    if arg.default is None:
-        # If no default is passed in, we treat bools as a normal parameter.
-        return arg
-    elif arg.default is False:
-        # Default `False` => --flag passed in flips to `True`.
-        return dataclasses.replace(
-            arg,
-            action="store_true",
-            type=None,
-            instantiator=lambda x: x,  # argparse will directly give us a bool!
-        )
-    elif arg.default is True:
-        # Default `True` => --no-flag passed in flips to `False`.
-        return dataclasses.replace(
-            arg,
-            dest=arg.name,
-            name="no_" + arg.name,
-            action="store_false",
-            type=None,
-            instantiator=lambda x: x,  # argparse will directly give us a bool!
-        )
+    Keys are built from the type and string forms of each value, since only the string
+    forms are kept in the argument definition and values that compare equal can still
+    produce different arguments (`1 == 1.0 == True`). Other types are excluded: their
+    string forms may not describe their contents."""
+    if isinstance(default, _CACHEABLE_DEFAULT_TYPES):
+        return _default_value_key(default)
+    elif type(default) in _CACHEABLE_DEFAULT_SEQUENCE_TYPES:
+        parts = []
+        for x in default:
+            if not isinstance(x, _CACHEABLE_DEFAULT_TYPES):
+                return None
+            parts.append(_default_value_key(x))
+        return (type(default), tuple(parts))
     else:
-        assert False, "Invalid default"
+        return None
 
 
-def _transform_recursive_instantiator_from_type(
-    arg: ArgumentDefinition,
-    type_from_typevar: Dict[TypeVar, Type],
-) -> ArgumentDefinition:
-    """The bulkiest bit: recursively analyze the type annotation and use it to determine how"""
-    if arg.instantiator is not None:
-        return arg
+def _default_value_key(x: Any) -> Hashable:
+    # `_as_str()` is the form passed to argparse, while `str()` is used for some
+    # helptext. These only differ for enums, eg when `__str__` is overridden.
+    return (type(x), _as_str(x), str(x))
+
 
-    instantiator, metadata = _instantiators.instantiator_from_type(
-        arg.type,  # type: ignore
-        type_from_typevar,
+@dataclasses.dataclass(frozen=True)
+class _FieldKey:
+    """Inputs to `ArgumentDefinition.make_from_field()`, hashed for memoization. The
+    field is fully determined by the parent class and field name."""
+
+    parent_class: Type
+    field_name: str
+    type_from_typevar: FrozenSet[Tuple[TypeVar, Type]]
+    default_key: Hashable
+
+    field: dataclasses.Field = dataclasses.field(compare=False)
+    default: Optional[Any] = dataclasses.field(compare=False)
+
+
+@functools.lru_cache(maxsize=256)
+def _make_from_field_cached(key: _FieldKey) -> ArgumentDefinition:
+    return _make_from_field(
+        key.parent_class, key.field, dict(key.type_from_typevar), key.default
     )
-    return dataclasses.replace(
-        arg,
-        instantiator=instantiator,
-        choices=metadata.choices,
-        nargs=metadata.nargs,
-        required=(not metadata.is_optional) and arg.required,
-        # Ignore metavar if choices is set.
-        metavar=metadata.metavar if metadata.choices is None else None,
+
+
+def _make_from_field(
+    parent_class: Type,
+    field: dataclasses.Field,
+    type_from_typevar: Dict[TypeVar, Type],
+    default: Optional[Any],
+) -> ArgumentDefinition:
+    arg = ArgumentDefinition(
+        prefix="",
+        field=field,
+        parent_class=parent_class,
+        instantiator=None,
+        name=field.name,
+        type=field.type,
+        default=default,
     )
+    _build_from_field(arg, type_from_typevar)
+    return arg
 
 
-def _transform_generate_helptext(arg: ArgumentDefinition) -> ArgumentDefinition:
-    """Generate helptext from docstring and argument name."""
-    help_parts = []
-    docstring_help = _docstrings.get_field_docstring(arg.parent_class, arg.field.name)
-    if docstring_help is not None:
-        # Note that the percent symbol needs some extra handling in argparse.
-        # https://stackoverflow.com/questions/21168120/python-argparse-errors-with-in-help-string
-        docstring_help = docstring_help.replace("%", "%%")
-        help_parts.append(docstring_help)
-
-    if arg.action is not None:
-        # Don't show defaults for boolean flags.
-        assert arg.action in ("store_true", "store_false")
-    elif arg.default is not None and isinstance(arg.default, enum.Enum):
-        # Special case for enums.
-        help_parts.append(f"(default: {arg.default.name})")
-    elif not arg.required:
-        # Include default value in helptext. We intentionally don't use the % template
-        # because the types of all arguments are set to strings, which will cause the
-        # default to be casted to a string and introduce extra quotation marks.
-        if arg.nargs is not None and hasattr(arg.default, "__iter__"):
-            # For tuple types, we might have arg.default as (0, 1, 2, 3).
-            # For list types, we might have arg.default as [0, 1, 2, 3].
-            # For set types, we might have arg.default as {0, 1, 2, 3}.
+@functools.lru_cache(maxsize=128)
+def _cached_field_docstring(cls: Type, field_name: str) -> Optional[str]:
+    """Memoized docstring lookup; repeated parses of the same class shouldn't require
+    re-tokenizing its source."""
+    return _docstrings.get_field_docstring(cls, field_name)
+
+
+# Keyword argument that our helptext reads the default value from.
+_DEFAULT_HELPTEXT_KEY = "default_helptext"
+_DEFAULT_HELPTEXT_TEMPLATE = f"(default: %({_DEFAULT_HELPTEXT_KEY})s)"
+
+
+class _StoreWithDefaultHelptext(argparse.Action):
+    """Equivalent to argparse's default "store" action, but also accepts a
+    `default_helptext` keyword argument.
+
+    This relies on documented argparse behavior: keyword arguments passed to
+    add_argument() are forwarded to the action class, and help strings can reference
+    them with `%(name)s` format specifiers. argparse only stringifies the value when help
+    is formatted."""
+
+    def __init__(
+        self, *args: Any, default_helptext: "_DefaultHelptext", **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.default_helptext = default_helptext
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: Optional[str] = None,
+    ) -> None:
+        setattr(namespace, self.dest, values)
+
+
+@dataclasses.dataclass(frozen=True)
+class _DefaultHelptext:
+    """Default value shown in helptext. Formatting is deferred to `__str__()`, which
+    argparse only calls if help is actually printed."""
+
+    default: Any
+    nargs: Optional[Union[int, str]]
+
+    def __str__(self) -> str:
+        if isinstance(self.default, enum.Enum):
+            # Special case for enums.
+            return self.default.name
+        elif self.nargs is not None and hasattr(self.default, "__iter__"):
+            # For tuple types, we might have default as (0, 1, 2, 3).
+            # For list types, we might have default as [0, 1, 2, 3].
+            # For set types, we might have default as {0, 1, 2, 3}.
             #
             # In all cases, we want to display (default: 0 1 2 3), for consistency with
             # the format that argparse expects when we set nargs.
-            assert arg.default is not None  # Just for type checker.
-            default_parts = map(shlex.quote, map(str, arg.default))
-            help_parts.append(f"(default: {' '.join(default_parts)})")
+            return " ".join([_maybe_quote(str(x)) for x in self.default])
         else:
-            help_parts.append(f"(default: {shlex.quote(str(arg.default))})")
+            return _maybe_quote(str(self.default))
 
-    return dataclasses.replace(arg, help=" ".join(help_parts))
 
+# Strings that `shlex.quote()` leaves unchanged. Empty strings are excluded, since those
+# are quoted.
+_SAFE_FOR_SHELL = re.compile(r"[\w@%+=:,./-]+", re.ASCII)
+
+
+def _maybe_quote(s: str) -> str:
+    """Equivalent to `shlex.quote()`, but skips the call for strings that don't need
+    quoting, like most numbers, paths, and enum names."""
+    return s if _SAFE_FOR_SHELL.fullmatch(s) else shlex.quote(s)
+
+
+@functools.lru_cache(maxsize=128)
+def _intern_tuple(x: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Intern choices and metavar tuples, so fields that share a type can share the same
+    tuple. Cached results are the first tuple seen for each value."""
+    return x
+
+
+def _identity(x: Any) -> Any:
+    return x
+
+
+def _as_str(x: Any) -> str:
+    if isinstance(x, enum.Enum):
+        return x.name
+    else:
+        return str(x)
 
-def _transform_convert_defaults_to_strings(
-    arg: ArgumentDefinition,
-) -> ArgumentDefinition:
-    """Sets all default values to strings, as required as input to our instantiator
-    functions. Special-cased for enums."""
 
-    def as_str(x: Any) -> str:
-        if isinstance(x, enum.Enum):
-            return x.name
+def _build_from_field(
+    arg: ArgumentDefinition,
+    type_from_typevar: Dict[TypeVar, Type],
+) -> None:
+    """Populate an argument definition in place, based on its type annotation, default
+    value, and docstring."""
+
+    if arg.type is bool and arg.default is not None:
+        # Boolean flags. If no default is passed in, we treat bools as a normal
+        # parameter.
+        if arg.default is False:
+            # Default `False` => --flag passed in flips to `True`.
+            arg.action = "store_true"
+        elif arg.default is True:
+            # Default `True` => --no-flag passed in flips to `False`.
+            arg.dest = arg.name
+            arg.name = "no_" + arg.name
+            arg.action = "store_false"
         else:
-            return str(x)
+            assert False, "Invalid default"
+        arg.type = None
+        arg.instantiator = _identity  # argparse will directly give us a bool!
+    else:
+        # The bulkiest bit: recursively analyze the type annotation and use it to
+        # determine how to instantiate the field.
+        instantiator, metadata = _instantiators.instantiator_from_type(
+            arg.type,  # type: ignore
+            type_from_typevar,
+        )
+        arg.instantiator = instantiator
 
+        # Important: as far as argparse is concerned, all inputs are strings.
+        #
+        # Conversions from strings to our desired types happen in the "field action";
+        # this is a bit more flexible, and lets us handle more complex types like enums
+        # and multi-type tuples.
+        arg.type = str
+
+        # Choices are compared against raw string inputs, so we stringify them once here.
+        arg.choices = (
+            None
+            if metadata.choices is None
+            else _intern_tuple(tuple(str(c) for c in metadata.choices))
+        )
+        arg.nargs = metadata.nargs
+        if arg.nargs is not None and arg.default is not None:
+            # Take an immutable copy of sequence defaults. Definitions are memoized, so
+            # they shouldn't reference objects that the caller may mutate later.
+            arg.default = tuple(arg.default)
+        # Mark arg as required if no default is set, unless the type is optional.
+        arg.required = (not metadata.is_optional) and arg.default is None
+        # Ignore metavar if choices is set.
+        if metadata.choices is None:
+            arg.metavar = (
+                _intern_tuple(metadata.metavar)
+                if isinstance(metadata.metavar, tuple)
+                else metadata.metavar
+            )
+
+    # Generate helptext from docstring and default value.
+    docstring_help = (
+        _cached_field_docstring(arg.parent_class, arg.field.name)  # type: ignore
+        if _docstrings.may_have_field_docstrings(arg.parent_class)  # type: ignore
+        else None
+    )
+    if docstring_help is not None:
+        # Note that the percent symbol needs some extra handling in argparse.
+        # https://stackoverflow.com/questions/21168120/python-argparse-errors-with-in-help-string
+        docstring_help = docstring_help.replace("%", "%%")
+
+    # Don't show defaults for boolean flags.
+    if arg.action is None and not arg.required:
+        # Include default value in helptext. We intentionally don't use argparse's
+        # %(default)s template because the types of all arguments are set to strings,
+        # which will cause the default to be casted to a string and introduce extra
+        # quotation marks; instead, we reference our own lazily formatted default.
+        arg.default_helptext = _DefaultHelptext(arg.default, arg.nargs)
+        arg.help = (
+            _DEFAULT_HELPTEXT_TEMPLATE
+            if not docstring_help
+            else docstring_help + " " + _DEFAULT_HELPTEXT_TEMPLATE
+        )
+    elif docstring_help:
+        arg.help = docstring_help
+
+    # Set all default values to strings, as required as input to our instantiator
+    # functions. Special-cased for enums.
     if arg.default is None or arg.action is not None:
-        return arg
+        return
     elif arg.nargs is not None:
-        return dataclasses.replace(arg, default=tuple(map(as_str, arg.default)))
+        # Because argparse requires matching choices for every element, sequence
+        # defaults are either all enums or contain no enums. We can check just the
+        # first element.
+        if len(arg.default) > 0 and isinstance(arg.default[0], enum.Enum):
+            arg.default = tuple(x.name for x in arg.default)
+        else:
+            arg.default = tuple(map(str, arg.default))
     else:
-        return dataclasses.replace(arg, default=as_str(arg.default))
+        arg.default = _as_str(arg.default)
@@ -5,7 +5,7 @@ import functools
 import inspect
 import io
 import tokenize
-from typing import Dict, List, Optional, Type
+from typing import Dict, Iterator, List, Optional, Type
 
 from typing_extensions import get_origin
 
@@ -34,6 +34,7 @@ class _ClassTokenization:
     tokens_from_logical_line: Dict[int, List[_Token]]
     tokens_from_actual_line: Dict[int, List[_Token]]
     field_data_from_name: Dict[str, _FieldData]
+    has_comments_or_strings: bool
 
     @staticmethod
     @functools.lru_cache(maxsize=8)
@@ -93,34 +94,48 @@ class _ClassTokenization:
             tokens_from_logical_line=tokens_from_logical_line,
             tokens_from_actual_line=tokens_from_actual_line,
             field_data_from_name=field_data_from_name,
+            has_comments_or_strings=any(
+                token.token_type in (tokenize.COMMENT, tokenize.STRING)
+                for token in tokens
+            ),
         )
 
 
-def get_class_tokenization_with_field(
-    cls: Type, field_name: str
-) -> Optional[_ClassTokenization]:
-    # Search for token in this class + all parents.
-    found_field: bool = False
-    classes_to_search = cls.mro()
-    for search_cls in classes_to_search:
+def _tokenize_dataclass_mro(cls: Type) -> Iterator[Optional[_ClassTokenization]]:
+    """Tokenize a class and its dataclass parents, in MRO order. If source code is
+    unavailable for a class, yields `None` and stops."""
+    for search_cls in cls.mro():
+        # Skip parent classes that aren't dataclasses. Note that this includes
+        # `typing.Generic`.
+        if not dataclasses.is_dataclass(search_cls):
+            continue
+
         # Inherited generics seem challenging for now.
         # https://github.com/python/typing/issues/777
         assert get_origin(search_cls) is None
 
-        # Skip parent classes that aren't dataclasses.
-        if not dataclasses.is_dataclass(search_cls):
-            continue
-
         try:
-            tokenization = _ClassTokenization.make(search_cls)  # type: ignore
+            yield _ClassTokenization.make(search_cls)  # type: ignore
         except OSError as e:
             # Dynamic dataclasses will result in an OSError -- this is fine, we just assume
             # there's no docstring.
             assert "could not find class definition" in e.args[0]
-            return None
+            yield None
+            return
         except TypeError as e:  # pragma: no cover
             # Notebooks cause “___ is a built-in class” TypeError.
             assert "built-in class" in e.args[0]
+            yield None
+            return
+
+
+def get_class_tokenization_with_field(
+    cls: Type, field_name: str
+) -> Optional[_ClassTokenization]:
+    # Search for token in this class + all parents.
+    found_field: bool = False
+    for tokenization in _tokenize_dataclass_mro(cls):
+        if tokenization is None:
             return None
 
         # Grab field-specific tokenization data.
@@ -136,6 +151,21 @@ def get_class_tokenization_with_field(
     return tokenization
 
 
+@functools.lru_cache(maxsize=16)
+def may_have_field_docstrings(cls: Type) -> bool:
+    """Cheap check for whether any field in a class could have a docstring. Returns
+    `False` if no dataclass in the class's MRO contains comments or string literals, in
+    which case `get_field_docstring()` will always return `None`."""
+    for tokenization in _tokenize_dataclass_mro(cls):
+        # Like in `get_class_tokenization_with_field()`, fields past a class without
+        # source code are treated as undocumented.
+        if tokenization is None:
+            break
+        if tokenization.has_comments_or_strings:
+            return True
+    return False
+
+
 def get_field_docstring(cls: Type, field_name: str) -> Optional[str]:
     """Get docstring for a field in a class."""
 
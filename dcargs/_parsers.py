@@ -319,11 +319,8 @@ class _NestedDataclassHandler(Generic[T]):
 
         child_args = child_definition.args
         for i, arg in enumerate(child_args):
-            child_args[i] = dataclasses.replace(
-                arg,
-                prefix=self.field.name
-                + _strings.NESTED_DATACLASS_DELIMETER
-                + arg.prefix,
+            child_args[i] = arg.with_prefix(
+                self.field.name + _strings.NESTED_DATACLASS_DELIMETER + arg.prefix
             )
 
         helptext_from_nested_dataclass_field_name = {
@@ -1,7 +1,7 @@
 import dataclasses
 import enum
 import pathlib
-from typing import ClassVar, Optional
+from typing import ClassVar, List, Optional, Tuple
 
 import pytest
 from typing_extensions import Annotated, Final, Literal  # Backward compatibility.
@@ -139,6 +139,49 @@ def test_default():
     assert dcargs.parse(A, args=[]) == A()
 
 
+def test_default_instance_repeated_enum():
+    class Mode(enum.Enum):
+        FAST = "f"
+        SLOW = "s"
+
+        def __str__(self) -> str:
+            return "Mode"
+
+    @dataclasses.dataclass
+    class A:
+        x: Mode = Mode.FAST
+
+    # Argument definitions are memoized; make sure these defaults aren't conflated.
+    assert dcargs.parse(A, args=[], default_instance=A(Mode.FAST)) == A(Mode.FAST)
+    assert dcargs.parse(A, args=[], default_instance=A(Mode.SLOW)) == A(Mode.SLOW)
+
+
+def test_default_instance_repeated_opaque_sequence():
+    class Seq:
+        """Iterable whose string form doesn't describe its contents."""
+
+        def __init__(self, values: List[int]) -> None:
+            self.values = values
+
+        def __iter__(self):
+            return iter(self.values)
+
+        def __str__(self) -> str:
+            return str(len(self.values))
+
+    @dataclasses.dataclass
+    class A:
+        x: Tuple[int, ...] = (0,)
+
+    # Argument definitions are memoized; make sure these defaults aren't conflated.
+    assert dcargs.parse(A, args=[], default_instance=A(x=Seq([1, 2, 3]))) == A(
+        x=(1, 2, 3)
+    )
+    assert dcargs.parse(A, args=[], default_instance=A(x=Seq([4, 5, 6]))) == A(
+        x=(4, 5, 6)
+    )
+
+
 def test_default_factory():
     @dataclasses.dataclass
     class A:
@@ -329,3 +329,99 @@ def test_optional_literal_helptext():
             dcargs.parse(OptionalLiteralHelptext, args=["--help"])
     helptext = f.getvalue()
     assert "--x {1,2,3}  A number. (default: None)\n" in helptext
+
+
+def test_helptext_percent_in_default():
+    @dataclasses.dataclass
+    class HelptextPercentDefault:
+        x: str = "50%"
+        """Helptext. 2% milk."""
+
+    f = io.StringIO()
+    with pytest.raises(SystemExit):
+        with contextlib.redirect_stdout(f):
+            dcargs.parse(HelptextPercentDefault, args=["--help"])
+    helptext = f.getvalue()
+    assert "--x STR     Helptext. 2% milk. (default: 50%)\n" in helptext
+
+
+def test_helptext_default_instance_repeated():
+    @dataclasses.dataclass
+    class HelptextDefaultInstance:
+        x: float = 5.0
+
+    def get_helptext(default_instance: HelptextDefaultInstance) -> str:
+        f = io.StringIO()
+        with pytest.raises(SystemExit):
+            with contextlib.redirect_stdout(f):
+                dcargs.parse(
+                    HelptextDefaultInstance,
+                    args=["--help"],
+                    default_instance=default_instance,
+                )
+        return f.getvalue()
+
+    # Argument definitions are memoized; defaults that compare equal shouldn't be
+    # conflated.
+    assert "--x FLOAT   (default: 1)\n" in get_helptext(HelptextDefaultInstance(x=1))
+    assert "--x FLOAT   (default: 1.0)\n" in get_helptext(
+        HelptextDefaultInstance(x=1.0)
+    )
+    assert "--x FLOAT   (default: 5.0)\n" in get_helptext(HelptextDefaultInstance())
+
+
+def test_helptext_default_instance_mutated():
+    @dataclasses.dataclass
+    class HelptextMutatedDefault:
+        x: List[int] = dataclasses.field(default_factory=list)
+
+    def get_helptext(default_instance: HelptextMutatedDefault) -> str:
+        f = io.StringIO()
+        with pytest.raises(SystemExit):
+            with contextlib.redirect_stdout(f):
+                dcargs.parse(
+                    HelptextMutatedDefault,
+                    args=["--help"],
+                    default_instance=default_instance,
+                )
+        return f.getvalue()
+
+    # Argument definitions are memoized; they shouldn't hold on to mutable defaults.
+    default_instance = HelptextMutatedDefault(x=[1, 2])
+    assert "(default: 1 2)\n" in get_helptext(default_instance)
+    default_instance.x.append(99)
+    assert "(default: 1 2)\n" in get_helptext(HelptextMutatedDefault(x=[1, 2]))
+
+
+def test_helptext_undocumented_child_of_documented_parent():
+    @dataclasses.dataclass
+    class DocumentedParent:
+        x: int
+        """Documented in the parent."""
+
+    @dataclasses.dataclass
+    class UndocumentedChild(DocumentedParent):
+        y: int = 3
+
+    f = io.StringIO()
+    with pytest.raises(SystemExit):
+        with contextlib.redirect_stdout(f):
+            dcargs.parse(UndocumentedChild, args=["--help"])
+    helptext = f.getvalue()
+    assert "--x INT     Documented in the parent.\n" in helptext
+    assert "--y INT     (default: 3)\n" in helptext
+
+
+def test_helptext_only_field_comment():
+    @dataclasses.dataclass
+    class OnlyFieldComment:
+        x: int
+        y: int = 3  # The only comment.
+
+    f = io.StringIO()
+    with pytest.raises(SystemExit):
+        with contextlib.redirect_stdout(f):
+            dcargs.parse(OnlyFieldComment, args=["--help"])
+    helptext = f.getvalue()
+    assert "--x INT\n" in helptext
+    assert "--y INT     The only comment. (default: 3)\n" in helptext